@@ -21,5 +21,15 @@ Description:
     Import necessary modules for easier access'
 '''
 from .domain.domain import Match, GoalEvent
-from .api import FootballAPI
-from .exceptions import FootballAPIError, APIConnectionError, APIResponseError, DataProcessingError
\ No newline at end of file
+from .exceptions import FootballAPIError, APIConnectionError, APIResponseError, DataProcessingError
+
+def __getattr__(name):
+    """Import FootballAPI on first access.
+
+    app.api pulls in requests, pydantic and the settings, so loading it eagerly
+    would make every `from app.<module> import ...` pay for them.
+    """
+    if name == "FootballAPI":
+        from .api import FootballAPI
+        return FootballAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -22,11 +22,13 @@ Description:
     fetching matches, goals, and related information.
 '''
 
+import os
 import json
 import requests
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from datetime import date, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
 
 from config import Settings
 from .domain.domain import Match
@@ -36,6 +38,11 @@ from .exceptions import APIConnectionError, APIResponseError, DataProcessingErro
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+TEST_DATA_PATH = "tests/test_data.json"
+
+# Parsed test data keyed by file path, stored with the file's mtime so edits are picked up
+_TEST_DATA_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
 class FootballAPI:
     """A client for interacting with the football data API.
 
@@ -47,6 +54,7 @@ class FootballAPI:
     config: Settings
     # Type hind for instance variable
     headers: Dict[str, str]
+    _session: Optional[requests.Session]
 
     def __init__(self, config: Settings, use_test_data: bool = False) -> None:
         """Initialize the FootballAPI client.
@@ -62,7 +70,41 @@ class FootballAPI:
         self.headers =  {
             "x-apisports-key": self.config.api_football_key.get_secret_value()
         }
-        logger.info(f"FootballAPI initialized with use_test_data={use_test_data}") # True / False
+        self._session = None
+        logger.info("FootballAPI initialized with use_test_data=%s", use_test_data) # True / False
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session shared by all API calls, created on first use.
+
+        Reusing one session keeps the connection to the API host alive between
+        requests, and sends the authentication headers by default.
+        Test data mode never creates it.
+
+        Returns:
+            requests.Session: The shared session.
+        """
+        if self._session is None:
+            logger.debug("Creating HTTP session for API-Football")
+            session = requests.Session()
+            session.headers.update(self.headers)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "FootballAPI":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def get_yesterdays_matches(self) -> List[Match]:
         """Retrieves football matches from yesterday.
@@ -84,24 +126,23 @@ class FootballAPI:
             logger.info("Using test data instead of API-Football api")
             return self._load_test_data()
 
-        yesterday: str = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+        yesterday: str = (date.today() - timedelta(days=1)).isoformat()
         endpoint: str = f"{self.config.api_football_url}/fixtures"
         params: Dict[str, str] = {
             "date": yesterday,
             "status": "FT-AET-PEN"
         }
 
-        logger.info(f"Fetching matches for {yesterday} from API")
-        logger.debug(f"API endpoint: {endpoint}")
-        logger.debug(f"API parameters: {params}")
+        logger.info("Fetching matches for %s from API", yesterday)
+        logger.debug("API endpoint: %s", endpoint)
+        logger.debug("API parameters: %s", params)
 
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = self.session.get(
                 endpoint,
-                headers=self.headers,
                 params=params
             )
-            logger.debug(f"API Response Status: {response.status_code}")
+            logger.debug("API Response Status: %s", response.status_code)
 
             if response.status_code != 200:
                 error_msg = f"API Error: {response.text}"
@@ -109,14 +150,24 @@ class FootballAPI:
                 raise APIResponseError(error_msg)
 
             data = response.json()
+            # API-Football reports invalid keys and exhausted quotas with HTTP 200,
+            # an empty response list and a non-empty errors object
+            if data.get("errors"):
+                error_msg = f"API Error: {data['errors']}"
+                logger.error(error_msg)
+                raise APIResponseError(error_msg)
+
             matches = self._process_api_response(data)
-            logger.info(f"Successfully retrieved {len(matches)} matches")
+            logger.info("Successfully retrieved %s matches", len(matches))
             return matches
 
         except requests.RequestException as e:
             error_msg = f"API request failed: {str(e)}"
             logger.error(error_msg, exc_info=True)
             raise APIConnectionError(error_msg)
+        except APIResponseError:
+            # Already logged above; propagate without rewrapping as a processing error
+            raise
         except Exception as e:
             error_msg = f"Error processing match data: {str(e)}"
             logger.error(error_msg, exc_info=True)
@@ -126,6 +177,8 @@ class FootballAPI:
     def _load_test_data(self) -> List[Match]:
         """Loads match data from a local test file for development purposes.
 
+        The parsed file is cached and reused until the file's modification time changes.
+
         Returns:
             List[Match]: A list of Match objects containing processed match data.
 
@@ -133,11 +186,17 @@ class FootballAPI:
             DataProcessingError: If there's an error loading or processing the test data.
         """
         try:
-            logger.info("Loading test data from tests/test_data.json")
-            with open('tests/test_data.json', 'r') as file:
-                test_data = json.load(file)
+            logger.info("Loading test data from %s", TEST_DATA_PATH)
+            mtime = os.stat(TEST_DATA_PATH).st_mtime_ns
+            cached = _TEST_DATA_CACHE.get(TEST_DATA_PATH)
+            if cached is not None and cached[0] == mtime:
+                test_data = cached[1]
+            else:
+                with open(TEST_DATA_PATH, 'r') as file:
+                    test_data = json.load(file)
+                _TEST_DATA_CACHE[TEST_DATA_PATH] = (mtime, test_data)
             matches = self._process_api_response(test_data)
-            logger.info(f"Successfully loaded {len(matches)} matches from test data")
+            logger.info("Successfully loaded %s matches from test data", len(matches))
             return matches
         except (FileNotFoundError, json.JSONDecodeError) as e:
             error_msg = f"Error loading test data: {str(e)}"
@@ -172,7 +231,7 @@ class FootballAPI:
                 for raw_match in validated_response.response
             ]
 
-            logger.debug(f"Processed {len(matches)} matches from API response")
+            logger.debug("Processed %s matches from API response", len(matches))
             return matches
 
         except Exception as e:
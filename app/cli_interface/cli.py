@@ -31,15 +31,42 @@ from rich.align import Align
 from rich.prompt import Prompt
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
+from functools import cached_property
+from config import Settings
 from app.database_manager.database import Database
 from datetime import datetime
-from app.llm import QnAEngine
 from app.domain.domain import Match
 import logging
 
+if TYPE_CHECKING:
+    from app.llm import QnAEngine
+
 logger = logging.getLogger(__name__)
 
+# Static panels are parsed from markup once here instead of on every print
+QUESTION_GUIDE_PANEL: Panel = Panel(
+    Text.from_markup(
+        "[bold cyan]Types of Questions You Can Ask:[/bold cyan]\n\n"
+        "[bold yellow]Match Results[/bold yellow]\n"
+        "  • [italic]What were yesterday's match results?[/italic]\n"
+        "  • [italic]How many matches ended in a home win?[/italic]\n"
+        "  • [italic]Which teams kept a clean sheet yesterday?[/italic]\n\n"
+        "[bold yellow]Score Details[/bold yellow]\n"
+        "  • [italic]Which match had the highest score?[/italic]\n"
+        "  • [italic]What was the halftime score in the CSA match?[/italic]\n"
+        "  • [italic]Were there any matches that went to extra time?[/italic]\n"
+    ),
+    title=Text.from_markup("[bold blue]Question Guide[/bold blue]"),
+    border_style="cyan",
+    padding=(1, 2)
+)
+GOODBYE_PANEL: Panel = Panel(
+    Text.from_markup("[yellow]Thanks for using goAI Talk! See you next time![/yellow]"),
+    border_style="cyan",
+    padding=(1, 2)
+)
+
 class CLI:
     """Command Line Interface for the goAI Talk application.
 
@@ -48,26 +75,40 @@ class CLI:
     """
     console: Console
     db: Database
-    qna_engine: QnAEngine
+    config: Settings
     current_date: str
     match_data: Optional[List[Match]]
+    leagues: Optional[List[str]]
 
-    def __init__(self, console: Console, db: Database, qna_engine: QnAEngine) -> None:
+    def __init__(self, console: Console, db: Database, config: Settings) -> None:
         """
         Initialize the CLI with injected dependencies.
 
         Args:
             console (console): An instance of the Rich Console for formatted output.
             db (Database): A pre-created Database instance.
-            qna_engine (QnAEngine): A pre-created QnAEngine instance for generating answers.
+            config (Settings): Application configuration settings, used to create the QnA engine.
         """
         self.console = console
         self.db = db
-        self.qna_engine = qna_engine
+        self.config = config
         self.current_date = datetime.today().strftime("%Y-%m-%d")
         self.match_data = None
+        self.leagues = None
         logger.info("CLI interface initialized")
 
+    @cached_property
+    def qna_engine(self) -> "QnAEngine":
+        """
+        QnA engine used to answer questions, created on the first question.
+
+        Sessions that only use commands such as help, info or exit never
+        import the OpenAI client or create the engine.
+        """
+        from app.llm import QnAEngine
+        logger.debug("Creating QnA engine on first question")
+        return QnAEngine(self.config, self.db)
+
     def _load_match_data(self) -> None:
         """
         Load match data from database.
@@ -75,8 +116,9 @@ class CLI:
         try:
             logger.debug("Loading match data from database")
             self.match_data = self.db.retrieve_yesterdays_matches_from_db()
+            self.leagues = None
             match_count = len(self.match_data) if self.match_data else 0
-            logger.info(f"Successfully loaded {match_count} matches")
+            logger.info("Successfully loaded %s matches", match_count)
         except Exception as e:
             error_msg = f"Could not load match data: {str(e)}"
             logger.error(error_msg, exc_info=True)
@@ -99,20 +141,7 @@ class CLI:
         """
         Display examples of questions that the user can ask.
         """
-        guide_text = (
-            "[bold cyan]Types of Questions You Can Ask:[/bold cyan]\n\n"
-            "[bold yellow]Match Results[/bold yellow]\n"
-            "  • [italic]What were yesterday's match results?[/italic]\n"
-            "  • [italic]How many matches ended in a home win?[/italic]\n"
-            "  • [italic]Which teams kept a clean sheet yesterday?[/italic]\n\n"
-            "[bold yellow]Score Details[/bold yellow]\n"
-            "  • [italic]Which match had the highest score?[/italic]\n"
-            "  • [italic]What was the halftime score in the CSA match?[/italic]\n"
-            "  • [italic]Were there any matches that went to extra time?[/italic]\n"
-        )
-        self.console.print(
-            Panel(guide_text, title="[bold blue]Question Guide[/bold blue]", border_style="cyan", padding=(1, 2))
-        )
+        self.console.print(QUESTION_GUIDE_PANEL)
         logger.debug("Qestion guide displayed")
 
     def display_data_context(self) -> None:
@@ -135,20 +164,23 @@ class CLI:
         self.console.print(
             Panel(context, title="[bold blue]Available Data Context[/bold blue]", border_style="cyan", padding=(1 ,2))
         )
-        logger.debug(f"Data context displayed: {match_count} matches from {match_date}")
+        logger.debug("Data context displayed: %s matches from %s", match_count, match_date)
 
     def get_leagues_from_data(self) -> List[str]:
         """
         Extract the unique league names from match data.
 
+        The list is built once per load of the match data and reused afterwards.
+
         Returns:
             List[str]: A sorted list of league names.
         """
         if not self.match_data:
             logger.warning("No match data available when getting leagues")
             return ["(Data not available)"]
-        leagues = {f"{match.league} ({getattr(match, 'country', 'Unknown')})" for match in self.match_data if match.league}
-        return sorted(list(leagues))
+        if self.leagues is None:
+            self.leagues = sorted({f"{match.league} ({getattr(match, 'country', 'Unknown')})" for match in self.match_data if match.league})
+        return self.leagues
 
     def process_user_input(self) -> str:
         """
@@ -158,7 +190,7 @@ class CLI:
             str: The input question from the user.
         """
         question = Prompt.ask("\n[bold green]Question[/bold green]")
-        logger.debug(f"User input: '{question}'")
+        logger.debug("User input: '%s'", question)
         return question
 
     def display_answer(self, answer: str) -> None:
@@ -172,7 +204,7 @@ class CLI:
             Panel(Text(answer, style="bright_white"), title="[bold blue]Answer[/bold blue]", border_style="cyan", padding=(1, 2))
         )
         truncated_answer = answer[:100] + "..." if len(answer) > 100 else answer
-        logger.debug(f"Displayed answer: '{truncated_answer}'")
+        logger.debug("Displayed answer: '%s'", truncated_answer)
 
     def run(self) -> None:
         """
@@ -193,21 +225,21 @@ class CLI:
         This abstracts part of the run loop for clarity.
         """
         question = self.process_user_input()
-        if question.lower() in ['exit', 'quit']:
+        # Normalize once and reuse for every command check
+        command = question.strip().lower()
+        if command in ['exit', 'quit']:
             logger.info("User requested to exit the application")
-            self.console.print(
-                Panel("[yellow]Thanks for using goAI Talk! See you next time![/yellow]", border_style="cyan", padding=(1, 2))
-            )
+            self.console.print(GOODBYE_PANEL)
             exit(0)
-        elif question.lower() in ['help', '?', 'examples']:
+        elif command in ['help', '?', 'examples']:
             logger.debug("User requested help")
             self.display_question_guide()
-        elif question.lower() in ['info', 'data', 'context']:
+        elif command in ['info', 'data', 'context']:
             logger.debug("User requested data context")
             self.display_data_context()
         else:
             try:
-                logger.info(f"Processing question: '{question}'")
+                logger.info("Processing question: '%s'", question)
                 with Progress(SpinnerColumn(), TextColumn("[bold blue]Thinking...[/bold blue]"), transient=True) as progress:
                     progress.add_task("generating", total=None)
                     answer = self.qna_engine.get_answer(question)
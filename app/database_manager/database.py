@@ -22,9 +22,12 @@ Description:
     and retrieving football match data including scores, teams, and goal details.
 '''
 
+import os
 import sqlite3
 import json
 import logging
+from datetime import datetime, timedelta, timezone
+from dataclasses import asdict
 from typing import List, Dict, Any, Optional
 from config import Settings
 from app.domain.domain import Match, GoalEvent
@@ -57,7 +60,7 @@ class Database:
 
         self.db_path = config.db_path
         self.use_test_data = use_test_data
-        logger.info(f"Database initialized with path: {self.db_path}")
+        logger.info("Database initialized with path: %s", self.db_path)
         self._create_tables()
 
     def _create_tables(self) -> None:
@@ -73,6 +76,9 @@ class Database:
             - home_score: Goals scored by home team
             - away_score: Goals scored by away team
             - goals: JSON string containing goal details
+
+        Creates a 'meta' key/value table used to record when match data
+        was last fetched (key 'last_fetch_utc').
         """
         logger.debug("Creating database tables if they don't exist")
         conn = sqlite3.connect(self.db_path)
@@ -92,6 +98,13 @@ class Database:
         )
         ''')
 
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+        ''')
+
         conn.commit()
         conn.close()
         logger.debug("Database tables created/verified successfully")
@@ -106,46 +119,118 @@ class Database:
             Uses INSERT OR REPLACE to handle both new entries and updates.
             Goal information is stored as a JSON string in the database.
         """
-        logger.info(f"Saving {len(matches)} matches to database")
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        cursor: sqlite3.Cursor = conn.cursor()
+        logger.info("Saving %s matches to database", len(matches))
 
-        for match in matches:
-            # Prepare a dictionary from the Match object; if your Match class doesn't have
-            # a conversion method, you might convert the dataclass to dict using asdict(match).
-            match_dict = {
-                "match_id": match.match_id,
-                "date": match.date,
-                "league": match.league,
-                "country": getattr(match, "country", ""), # Ensure to handle field accordingly.
-                "home_team": match.home_team,
-                "away_team": match.away_team,
-                "home_score": match.home_score,
-                "away_score": match.away_score,
-                "goals": json.dumps([goal.__dict__ for goal in match.goal_events])
-            }
-
-            logger.debug(f"Saving match {match.match_id}: {match.home_team} vs {match.away_team}")
-            cursor.execute('''
-            INSERT OR REPLACE INTO matches
-            (match_id, date, league, country, home_team, away_team, home_score, away_score, goals)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                match_dict['match_id'],
-                match_dict['date'],
-                match_dict['league'],
-                match_dict['country'],
-                match_dict['home_team'],
-                match_dict['away_team'],
-                match_dict['home_score'],
-                match_dict['away_score'],
-                match_dict['goals'],
-            ))
+        # Build the row tuples straight from the Match attributes, in column order
+        rows: List[tuple] = [
+            (
+                match.match_id,
+                match.date,
+                match.league,
+                getattr(match, "country", ""), # Ensure to handle field accordingly.
+                match.home_team,
+                match.away_team,
+                match.home_score,
+                match.away_score,
+                # Compact separators keep the stored JSON free of padding whitespace
+                json.dumps([asdict(goal) for goal in match.goal_events], separators=(",", ":"))
+            )
+            for match in matches
+        ]
 
-        conn.commit()
-        conn.close()
+        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
+        try:
+            # One executemany call inside a single transaction (committed by the context manager)
+            with conn:
+                conn.executemany('''
+                INSERT OR REPLACE INTO matches
+                (match_id, date, league, country, home_team, away_team, home_score, away_score, goals)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+        finally:
+            conn.close()
         logger.info("Matches saved successfully")
 
+    def set_last_fetch_time(self, fetched_at: datetime) -> None:
+        """Record when match data was last fetched and saved.
+
+        Args:
+            fetched_at (datetime): Timezone-aware time of the fetch.
+        """
+        logger.debug("Recording last fetch time: %s", fetched_at.isoformat())
+        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                    ("last_fetch_utc", fetched_at.astimezone(timezone.utc).isoformat())
+                )
+        finally:
+            conn.close()
+
+    def get_last_fetch_time(self) -> Optional[datetime]:
+        """Return when match data was last fetched and saved.
+
+        Returns:
+            Optional[datetime]: Timezone-aware UTC time of the last recorded fetch,
+            or None if no fetch has been recorded or it cannot be read.
+        """
+        conn: Optional[sqlite3.Connection] = None
+        try:
+            conn = sqlite3.connect(self.db_path)
+            row = conn.execute(
+                'SELECT value FROM meta WHERE key = ?', ("last_fetch_utc",)
+            ).fetchone()
+            return datetime.fromisoformat(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.error("Could not read last fetch time: %s", e, exc_info=True)
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+    def is_data_fresh(self, ttl_hours: float) -> bool:
+        """Check whether stored match data is recent enough to skip a fetch.
+
+        Data is fresh if it was fetched less than `ttl_hours` ago and on the
+        current local day; once the day changes, "yesterday" refers to a
+        different date and the stored matches are out of date.
+
+        Args:
+            ttl_hours (float): Maximum age of the data in hours.
+
+        Returns:
+            bool: True if the data can be reused, False if it should be fetched again.
+        """
+        last_fetch: Optional[datetime] = self.get_last_fetch_time()
+        if last_fetch is None:
+            logger.debug("No recorded fetch time, data is stale")
+            return False
+
+        now: datetime = datetime.now(timezone.utc)
+        if last_fetch.astimezone().date() != now.astimezone().date():
+            logger.debug("Data was fetched on a previous day, data is stale")
+            return False
+
+        age: timedelta = now - last_fetch
+        logger.debug("Data age: %s, TTL: %sh", age, ttl_hours)
+        return age < timedelta(hours=ttl_hours)
+
+    def get_last_modified(self) -> Optional[int]:
+        """Return the modification time of the database file.
+
+        Lets callers that cache match data detect changes with a single
+        stat call instead of querying the database.
+
+        Returns:
+            Optional[int]: Modification time in nanoseconds, or None if the
+            database file cannot be accessed.
+        """
+        try:
+            return os.stat(self.db_path).st_mtime_ns
+        except OSError:
+            return None
+
     def retrieve_yesterdays_matches_from_db(self, max_matches: Optional[int] = None) -> List[Match]:
         """Retrieve yesterday's match data from database.
 
@@ -163,7 +248,7 @@ class Database:
         Raises:
             sqlite3.Error: If there's an error accessing the database.
         """
-        logger.info(f"Retrieving matches from database (max_matches={max_matches})")
+        logger.info("Retrieving matches from database (max_matches=%s)", max_matches)
         conn: Optional[sqlite3.Connection] = None
         matches: List[Match] = []
         try:
@@ -173,7 +258,7 @@ class Database:
 
             # Query with optional limit
             if max_matches:
-                logger.debug(f"Limiting query to {max_matches} matches")
+                logger.debug("Limiting query to %s matches", max_matches)
                 cursor.execute('SELECT * FROM matches LIMIT ?', (max_matches,))
             else:
                 cursor.execute('SELECT * FROM matches')
@@ -204,7 +289,7 @@ class Database:
 
                 matches.append(match)
 
-            logger.info(f"Retrieved {len(matches)} matches from database")
+            logger.info("Retrieved %s matches from database", len(matches))
             return matches
         except sqlite3.Error as e:
             error_msg = f"Database error: {e}"
@@ -23,7 +23,7 @@ Description:
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class GoalEvent:
     """Represents a goal scored during a football match.
 
@@ -36,7 +36,7 @@ class GoalEvent:
     player: str
     minute: int
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """Represents a football match with its details.
 
@@ -22,7 +22,7 @@ Description:
     It handles conversation history, token limits, and formats answers accordingly.
 '''
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any
 from config import Settings
 import logging
 from app.database_manager.database import Database
@@ -35,6 +35,31 @@ from app.exceptions import DataProcessingError, APIConnectionError
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+# Static part of the system prompt; only the match count is filled in per prompt
+PROMPT_HEADER_TEMPLATE: str = """You are a friendly and knowledgeable yesterday's football match results assistant.
+                     Your role is to provide clear, properly formatted, and detailed information about yesterday's football matches.
+                     You should answer in the same language as the user's question.
+
+                     FORMATTING REQUIREMENTS:
+                         1. Format your responses with proper alignment and structure
+                         2. Use consistent indentation and spacing
+                         3. For tabular data (like match results), maintain proper alignment
+                         4. When listing matches, use a consistent format for all entries
+                         5. Use appropriate headers and separators for different sections
+                         6. Avoid extraneous whitespace characters that could disrupt terminal display
+                         7. Do not add extra spaces at the beginning of lines
+                         8. Format match results in a clean, structured way, e.g.:
+                             • Liga MX (Mexico):
+                             • Atlas W 2-1 Monterrey W
+                             • Necaxa W 1-0 León W
+                         9. For multiple leagues, use clear section headers
+                         10. For statistics, use consistent formatting throughout
+
+                     Available Matches: {match_count}
+
+                     Match Data:
+        """
+
 class QnAEngine:
     """A Question-Answering engine for yesterday football match results using OpenAI's API."""
     config: Settings
@@ -43,6 +68,7 @@ class QnAEngine:
     max_token_limit: int
     match_limit: int
     conversation_history: List[Dict[str, str]]
+    _match_cache: Dict[str, Any]
 
     def __init__(self, config: Settings, db: Database) -> None:
         """Initialize the QnAEngine with configuration and an injected Database instance."""
@@ -52,7 +78,12 @@ class QnAEngine:
         self.max_token_limit = 16385 # GTP-3.5-turbo context window size
         self.match_limit = self.config.match_limit
         self.conversation_history = []
-        logger.info(f"QnAEngine initialized with match_limit={self.match_limit}")
+        self._match_cache = {
+            "db_modified": None,
+            "matches": None,
+            "prompt": None
+        }
+        logger.info("QnAEngine initialized with match_limit=%s", self.match_limit)
 
     def get_answer(self, question: str) -> str:
         """
@@ -66,31 +97,35 @@ class QnAEngine:
             DataProcessingError: If there is no match data or an error retrieving data.
             APIConnectionError: If there is an error connecting to the OpenAI API.
         """
-        logger.info(f"Processing question: '{question}'")
+        logger.info("Processing question: '%s'", question)
         try:
-            matches: List[Match] = self.db.retrieve_yesterdays_matches_from_db()
+            matches: List[Match] = self._get_cached_matches()
             if not matches:
                 error_msg = "No match data available"
                 logger.error(error_msg)
                 return DataProcessingError(error_msg)
 
             limited_matches: List[Match] = self._limit_matches_by_size(matches)
-            logger.debug(f"Using {len(limited_matches)} matches for answering")
+            logger.debug("Using %s matches for answering", len(limited_matches))
 
             # Update conversation history
             self.conversation_history.append({"role": "user", "content": question})
-            logger.debug(f"conversation history size: {len(self.conversation_history)}")
+            logger.debug("conversation history size: %s", len(self.conversation_history))
 
             # Keep recent converations based on config limit
             if len(self.conversation_history) > self.config.max_conversation_history * 2:
                 self.conversation_history = self.conversation_history[
                     -(self.config.max_conversation_history * 2):
                 ]
-                logger.debug(f"Trimmed conversation history to {len(self.conversation_history)} entries")
+                logger.debug("Trimmed conversation history to %s entries", len(self.conversation_history))
+
+            # The prompt only depends on the match data, so build it once per cache refresh
+            if self._match_cache["prompt"] is None:
+                self._match_cache["prompt"] = self._create_prompt(limited_matches)
 
             # Prepare messages for API request using the system prompt and coversation history
             messages: List[Dict[str, str]] = [
-                {"role": "system", "content": self._create_prompt(limited_matches)},
+                {"role": "system", "content": self._match_cache["prompt"]},
                 *self.conversation_history
             ]
 
@@ -105,7 +140,7 @@ class QnAEngine:
 
                 # Log a truncated version of the answer to avoid excessive logging.
                 truncated_answer = answer[:100] + "..." if len(answer) > 100 else answer
-                logger.info(f"Generated answer: '{truncated_answer}'")
+                logger.info("Generated answer: '%s'", truncated_answer)
 
                 self.conversation_history.append({"role": "assistant", "content": answer})
                 return answer
@@ -117,13 +152,40 @@ class QnAEngine:
 
         except DataProcessingError as e:
             # Log the error but let it propagate to the caller for handling
-            logger.error(f"Data processing error: {str(e)}", exc_info=True)
+            logger.error("Data processing error: %s", e, exc_info=True)
             raise
         except APIConnectionError as e:
             # Log the error but let it propagate to the caller for handling
-            logger.error(f"API connection error: {str(e)}", exc_info=True)
+            logger.error("API connection error: %s", e, exc_info=True)
             raise
 
+    def _get_cached_matches(self) -> List[Match]:
+        """
+        Return match data, reading the database only when it has changed.
+
+        The database file's modification time is checked on each call and the
+        matches are re-read only when it differs from the cached one, so repeated
+        questions skip the SQLite query and the Match object construction.
+        Empty results are not cached, so freshly saved data is picked up
+        on the next question.
+
+        Returns:
+            List[Match]: The cached list of matches.
+        """
+        db_modified = self.db.get_last_modified()
+        if (self._match_cache["db_modified"] is None or
+            db_modified != self._match_cache["db_modified"]):
+
+            logger.debug("Database changed, refreshing match cache")
+            matches: List[Match] = self.db.retrieve_yesterdays_matches_from_db()
+            self._match_cache["matches"] = matches
+            self._match_cache["prompt"] = None
+            self._match_cache["db_modified"] = db_modified if matches else None
+        else:
+            logger.debug("Using cached match data")
+
+        return self._match_cache["matches"]
+
     def _retry_with_less_data(self, question: str, matches: List[Match]) -> str:
         """Retry answer generation with reduced match data when initial attempt fails.
 
@@ -140,7 +202,7 @@ class QnAEngine:
         try:
             logger.info("Retrying with reduced match data")
             reduced_limit = max(1, self.match_limit - 10)
-            logger.debug(f"Reduced match limit to {reduced_limit}")
+            logger.debug("Reduced match limit to %s", reduced_limit)
             reduced_matches: List[Match] = self._limit_matches_by_size(matches, reduced_limit)
 
             messages: List[Dict[str, str]] = [
@@ -175,7 +237,7 @@ class QnAEngine:
             List[Match]: A limited subset of the original matches list.
         """
         limit_to_use: int = limit if limit is not None else self.match_limit
-        logger.debug(f"Limiting matches to {limit_to_use} (from {len(matches)} total)")
+        logger.debug("Limiting matches to %s (from %s total)", limit_to_use, len(matches))
         return matches[:limit_to_use]
 
     def _create_prompt(self, matches: List[Match]) -> str:
@@ -189,39 +251,19 @@ class QnAEngine:
             str: A formatted system prompt containing match data.
         """
         match_count: int = len(matches)
-        logger.debug(f"Creating prompt with {match_count} matches")
-
-        prompt: str = f"""You are a friendly and knowledgeable yesterday's football match results assistant.
-                     Your role is to provide clear, properly formatted, and detailed information about yesterday's football matches.
-                     You should answer in the same language as the user's question.
-
-                     FORMATTING REQUIREMENTS:
-                         1. Format your responses with proper alignment and structure
-                         2. Use consistent indentation and spacing
-                         3. For tabular data (like match results), maintain proper alignment
-                         4. When listing matches, use a consistent format for all entries
-                         5. Use appropriate headers and separators for different sections
-                         6. Avoid extraneous whitespace characters that could disrupt terminal display
-                         7. Do not add extra spaces at the beginning of lines
-                         8. Format match results in a clean, structured way, e.g.:
-                             • Liga MX (Mexico):
-                             • Atlas W 2-1 Monterrey W
-                             • Necaxa W 1-0 León W
-                         9. For multiple leagues, use clear section headers
-                         10. For statistics, use consistent formatting throughout
-
-                     Available Matches: {match_count}
-
-                     Match Data:
-        """
-        # Append match information using domain object attributes
-        for match in matches:
-            country = match.country if match.country else "Unknown country"
-            prompt += f"\n{match.league} ({country}):"
-            prompt += f"\n{match.home_team} {match.home_score} vs {match.away_score} {match.away_team}\n"
-            
+        logger.debug("Creating prompt with %s matches", match_count)
+
+        prompt_header: str = PROMPT_HEADER_TEMPLATE.format(match_count=match_count)
+        # Append match information using domain object attributes.
+        # Entries are collected and joined once instead of growing the prompt string per match.
+        match_entries: List[str] = [
+            f"\n{match.league} ({match.country if match.country else 'Unknown country'}):"
+            f"\n{match.home_team} {match.home_score} vs {match.away_score} {match.away_team}\n"
+            for match in matches
+        ]
+        prompt: str = prompt_header + "".join(match_entries)
 
         # Log a truncated version of the prompt to avoid excessive logging
         truncated_prompt = prompt[:200] + "..." if len(prompt) > 200 else prompt
-        logger.debug(f"Created promt: {truncated_prompt}")
+        logger.debug("Created promt: %s", truncated_prompt)
         return prompt
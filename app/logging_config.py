@@ -22,22 +22,69 @@ Description:
 '''
 
 import os
+import atexit
+import queue
 from datetime import datetime
 import logging
 import logging.handlers
+from typing import Optional
 
-def setup_logging(debug_mode=False, console_logs=True):
+# Shared by the file and console handlers so the format is parsed once
+LOG_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+# Background listener that writes queued records to the log file
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_queue_listener():
+    """Flush queued records to the log file, stop the background listener and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
+def _remove_old_logs(log_dir, retention_days):
+    """
+    Delete log files older than the retention period.
+
+    A new log file is started every day, so without cleanup the log
+    directory grows without bound.
+
+    Args:
+        log_dir (str): Directory containing the log files
+        retention_days (int): Log files last modified before this many days ago are removed
+    """
+    cutoff = datetime.now().timestamp() - retention_days * 86400
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith("goal_talk"):
+                continue
+            # Another process may prune the same file concurrently, so a file
+            # vanishing between listing, stat and remove is not an error
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+def setup_logging(debug_mode=False, console_logs=True, retention_days=None):
     """
     Configure the logging system.
 
     Args:
         debug_mode (bool): If True, enables more detailed debug logging
         console_logs (bool): If True, logs will be output to console. If False, logs only to file
+        retention_days (Optional[int]): If set, log files older than this many days are removed.
+            If None, all log files are kept
     """
     # Create log directory if it doesn't exist
     log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
+    if retention_days is not None:
+        _remove_old_logs(log_dir, retention_days)
 
     # Set log file name with current date
     log_filename = os.path.join(log_dir, f"goal_talk{datetime.now().strftime('%Y%m%d')}.log")
@@ -65,15 +112,20 @@ def setup_logging(debug_mode=False, console_logs=True):
         backupCount=5,
         encoding="utf-8"
     )
-    file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    file_handler.setFormatter(LOG_FORMATTER)
+
+    # File writes happen on a listener thread; callers only put records on a queue
+    global _queue_listener
+    _stop_queue_listener()
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _queue_listener.start()
 
     # Configire console handler (optional)
     if console_logs:
         console_handler = logging.StreamHandler()
-        console_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(LOG_FORMATTER)
         root_logger.addHandler(console_handler)
 
     # This prevents HTTP client libraries from flooding logs with debug information
@@ -84,6 +136,6 @@ def setup_logging(debug_mode=False, console_logs=True):
     if debug_mode:
         logging.debug("Debug logging enabled")
 
-    logging.info(f"Logging initialized. Log file: {log_filename}")
+    logging.info("Logging initialized. Log file: %s", log_filename)
 
     return root_logger
\ No newline at end of file
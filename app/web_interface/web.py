@@ -24,15 +24,18 @@ Description:
     with football match Q&A functionality.
 '''
 
-import os
 import sys
-import uvicorn
 import logging
-from typing import List, Optional, Tuple, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 from datetime import datetime
 
-# Add parent dir to sys.path to import other modules in the other dirs
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Directory of this module, resolved once and reused for all paths below
+WEB_DIR: Path = Path(__file__).resolve().parent
+
+# Add project root to sys.path to import other modules in the other dirs
+sys.path.append(str(WEB_DIR.parents[1]))
 
 from fastapi import FastAPI, Request, Form
 from fastapi.templating import Jinja2Templates
@@ -42,26 +45,45 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from config import settings
 from app.config.example_questions import EXAMPLE_QUESTIONS
 from app.database_manager.database import Database
-from app.llm import QnAEngine
 from app.domain.domain import Match
 from app.exceptions import DataProcessingError, APIConnectionError
 
+if TYPE_CHECKING:
+    from app.llm import QnAEngine
+
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
 app: FastAPI = FastAPI(title="goAI Talk")
-templates = Jinja2Templates(directory=os.path.join(os.path.dirname(__file__), "templates"))
-app.mount("/static", StaticFiles(directory=os.path.join(os.path.dirname(__file__), "static")), name="static")
-
-# Dependency injection: QnAEngine and Database are created using settings.
-db: Database = Database(settings)
-qna_engine: QnAEngine = QnAEngine(settings, db)
+templates = Jinja2Templates(directory=str(WEB_DIR / "templates"))
+app.mount("/static", StaticFiles(directory=str(WEB_DIR / "static")), name="static")
+
+# Dependency injection: QnAEngine and Database are created using settings,
+# on first use rather than at import time.
+@lru_cache(maxsize=1)
+def get_db() -> Database:
+    """Return the shared Database instance, creating it on first call."""
+    return Database(settings)
+
+@lru_cache(maxsize=1)
+def get_qna_engine() -> "QnAEngine":
+    """Return the shared QnAEngine instance, creating it on the first question."""
+    from app.llm import QnAEngine
+    return QnAEngine(settings, get_db())
+
+def __getattr__(name: str):
+    """Keep the module-level `db` and `qna_engine` names available lazily (PEP 562)."""
+    if name == "db":
+        return get_db()
+    if name == "qna_engine":
+        return get_qna_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Format current time in the user time zone.
 CURRENT_TIME: str = datetime.today().strftime("%Y-%m-%d %H:%M:%S")
 
 _match_cache = {
-    "last_updated": None,
+    "db_modified": None,
     "matches": None,
     "date": "yesterday",
     "count": 0
@@ -72,28 +94,30 @@ def get_match_context() -> Tuple[str, int]:
     Fetch match data one and return the match date and match count.
     Uses caching to avoid multiple database calls within the same request cycle.
 
-    The cache is refreshed every 5 minutes (300 seconds) to ensure data
-    stays reasonably current while reducing database load.
+    The cache is refreshed only when the database file's modification time
+    changes, so new data is shown as soon as it is saved while unchanged
+    data costs a single stat call per request.
 
     Returns:
         Tuple[str, int]: The match date and the total count of matches.
     """
     # Check if cache needs to be initialized or refreshed
-    current_time = datetime.now()
-    if (_match_cache["last_updated"] is None or
-        (current_time - _match_cache["last_updated"]).total_seconds() > 300):
+    db: Database = get_db()
+    db_modified = db.get_last_modified()
+    if (_match_cache["db_modified"] is None or
+        db_modified != _match_cache["db_modified"]):
 
-        logger.debug("Match context cache expired, refreshing from database")
+        logger.debug("Database changed, refreshing match context cache")
         all_matches: List[Match] = db.retrieve_yesterdays_matches_from_db()
 
         _match_cache["matches"] = all_matches
         _match_cache["count"] = len(all_matches)
-        _match_cache["last_updated"] = current_time
+        _match_cache["db_modified"] = db_modified
 
         if all_matches and len(all_matches) > 0:
             _match_cache["date"] = all_matches[0].date
     
-        logger.debug(f"Updated match context cache: date={_match_cache['date']}, count={_match_cache['count']}")
+        logger.debug("Updated match context cache: date=%s, count=%s", _match_cache['date'], _match_cache['count'])
     else:
         logger.debug("Using cached match context data")
     
@@ -102,10 +126,10 @@ def get_match_context() -> Tuple[str, int]:
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request, prefill: Optional[str] = None) -> HTMLResponse:
     """Renders the main page of the application."""
-    logger.info(f"GET / - IP: {request.client.host}")
+    logger.info("GET / - IP: %s", request.client.host)
     match_date, match_count = get_match_context()
 
-    logger.debug(f"Rendering index with prefill={prefill}")
+    logger.debug("Rendering index with prefill=%s", prefill)
     return templates.TemplateResponse(
         "index.html", 
         {
@@ -120,7 +144,7 @@ async def index(request: Request, prefill: Optional[str] = None) -> HTMLResponse
 @app.post("/ask", response_class=HTMLResponse, response_model=None)
 async def ask(request: Request, question: str = Form(...)) -> Union[HTMLResponse, RedirectResponse]:
     """Processes user questions about football matches."""
-    logger.info(f"POST /ask - IP: {request.client.host}, Question: '{question}'")
+    logger.info("POST /ask - IP: %s, Question: '%s'", request.client.host, question)
 
     if not question.strip():
         logger.warning("Empty question submitted, redirecting to home page")
@@ -129,21 +153,21 @@ async def ask(request: Request, question: str = Form(...)) -> Union[HTMLResponse
     match_date, match_count = get_match_context()
 
     try:
-        logger.debug(f"Processing question: '{question}'")
-        answer: str = qna_engine.get_answer(question)
+        logger.debug("Processing question: '%s'", question)
+        answer: str = get_qna_engine().get_answer(question)
 
         truncated_answer = answer[:100] + "..." if len(answer) > 10 else answer
-        logger.debug(f"Answer generated: '{truncated_answer}'")
+        logger.debug("Answer generated: '%s'", truncated_answer)
 
     except Exception as e:
         if isinstance(e, DataProcessingError):
-            logger.error(f"Data processing error: {str(e)}", exc_info=True)
+            logger.error("Data processing error: %s", e, exc_info=True)
             answer = f"Sorry, I encountered an error processing match data: {str(e)}"
         elif isinstance(e, APIConnectionError):
-            logger.error(f"API connection error: {str(e)}", exc_info=True)
+            logger.error("API connection error: %s", e, exc_info=True)
             answer = f"Sorry, I couldn't connect to the AI service. Please try again later."
         else:
-            logger.erro(f"Unexpected error: {type(e).__name__}: {str(e)}", exc_info=True)
+            logger.error("Unexpected error: %s: %s", type(e).__name__, e, exc_info=True)
             answer = f"An unexpected error occurred. Please try asking another question."
 
     return templates.TemplateResponse(
@@ -161,7 +185,7 @@ async def ask(request: Request, question: str = Form(...)) -> Union[HTMLResponse
 @app.get("/examples", response_class=HTMLResponse)
 async def examples(request: Request) -> HTMLResponse:
     """Provides example questions based on available match data."""
-    logger.info(f"GET /examples - IP: {request.client.host}")
+    logger.info("GET /examples - IP: %s", request.client.host)
     return templates.TemplateResponse(
         "examples.html",
         {
@@ -178,7 +202,8 @@ async def favicon() -> RedirectResponse:
 
 def run_server(host: str="0.0.0.0", port: int = 8000) -> None:
     """Starts the FastAPI web server."""
-    logger.info(f"Starting web server on {host}:{port}")
+    import uvicorn
+    logger.info("Starting web server on %s:%s", host, port)
     uvicorn.run(app, host=host, port=port)
 
 if __name__ == "__main__":
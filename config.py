@@ -2,17 +2,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 '''
-          ___
-      .:::---:::.
-    .'--:     :--'.                      ___     ____   ______        __ __  
-   /.'   \   /   `.\      ____ _ ____   /   |   /  _/  /_  __/____ _ / // /__
-  | /'._ /:::\ _.'\ |    / __ `// __ \ / /| |   / /     / /  / __ `// // //_/
-  |/    |:::::|    \|   / /_/ // /_/ // ___ | _/ /     / /  / /_/ // // ,<   
-  |:\ .''-:::-''. /:|   \__, / \____//_/  |_|/___/    /_/   \__,_//_//_/|_|  
-   \:|    `|`    |:/   /____/                                                
-    '.'._.:::._.'.'
-      '-:::::::-'
-
 goAI_talk - Yesterday's Football Match Results Q&A Bot
 File: config.py
 Author: Hosu Kim
@@ -23,6 +12,7 @@ Description:
     and environment variable management.
 '''
 
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import SecretStr
 
@@ -51,5 +41,7 @@ class Settings(BaseSettings):
 
     match_limit: int = 300 # Maximum number of matches to process at once
     max_conversation_history: int = 5 # Number of conversation turns to retain
+    data_ttl_hours: float = 6 # Hours before stored match data is fetched again
+    log_retention_days: Optional[int] = None # Days to keep log files; None keeps them all
 
 settings = Settings()
\ No newline at end of file
@@ -1,56 +1,63 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 '''
-          ___
-      .:::---:::.
-    .'--:     :--'.                      ___     ____   ______        __ __  
-   /.'   \   /   `.\      ____ _ ____   /   |   /  _/  /_  __/____ _ / // /__
-  | /'._ /:::\ _.'\ |    / __ `// __ \ / /| |   / /     / /  / __ `// // //_/
-  |/    |:::::|    \|   / /_/ // /_/ // ___ | _/ /     / /  / /_/ // // ,<   
-  |:\ .''-:::-''. /:|   \__, / \____//_/  |_|/___/    /_/   \__,_//_//_/|_|  
-   \:|    `|`    |:/   /____/                                                
-    '.'._.:::._.'.'
-      '-:::::::-'
-
 goAI Talk - Football Match Results Q&A Bot
 File: main.py
 Author: Hosu Kim
 Created: 2025-03-15 20:17:52 UTC
 
 Description:
-    This module provides the FootballAPI class to interact with the football data API,
-    fetching matches, goals, and related information.
+    Application entry point. Parses command line options, updates match data
+    when needed and starts the CLI or web interface.
 '''
 import argparse
-from typing import List
-from rich.console import Console
-from app.api import FootballAPI
-from app.database_manager.database import Database
-from app.cli_interface.cli import CLI
-from app.web_interface.web import run_server
-from app.domain.domain import Match
-from app.llm import QnAEngine
-from config import settings
-# Used for logging setup
 import logging
-from app.logging_config import setup_logging
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Application modules are imported inside the functions that use them, so that
+# `--help` and argument errors return without loading requests, pydantic or the settings.
+
+def print_banner() -> None:
+    """Print the goAI Talk ASCII art banner from banner.txt."""
+    print(Path(__file__).with_name("banner.txt").read_text(encoding="utf-8"))
 
-def update_data(use_test_data: bool = False) -> None:
+def update_data(use_test_data: bool = False, ttl_hours: Optional[float] = None, force: bool = False) -> None:
     """Fetch latest data from API (of test_data.json) and save to DB
 
+    The fetch is skipped when the stored data is still fresh, so repeated
+    launches within the TTL window neither call the API nor rewrite the DB.
+
     Args:
          use_test_data (bool): Whether to use test data instead of live API. Defaults to False.
+         ttl_hours (Optional[float]): Maximum age of stored data in hours.
+                                      Defaults to settings.data_ttl_hours.
+         force (bool): Fetch even if the stored data is still fresh. Defaults to False.
     """
-    api: FootballAPI = FootballAPI(settings, use_test_data=use_test_data)
+    from datetime import datetime, timezone
+    from app.api import FootballAPI
+    from app.database_manager.database import Database
+    from app.domain.domain import Match
+    from config import settings
+
+    if ttl_hours is None:
+        ttl_hours = settings.data_ttl_hours
     db: Database = Database(settings, use_test_data=use_test_data)
-    
+    if not force and db.is_data_fresh(ttl_hours):
+        logging.info("Match data is less than %s hours old, skipping update", ttl_hours)
+        return
+
     logging.info("Fetching latest football match data...")
     try:
-        matches: List[Match] = api.get_yesterdays_matches()
+        with FootballAPI(settings, use_test_data=use_test_data) as api:
+            matches: List[Match] = api.get_yesterdays_matches()
         db.save_matches(matches)
-        logging.info(f"Saved {len(matches)} match records.")
+        db.set_last_fetch_time(datetime.now(timezone.utc))
+        logging.info("Saved %d match records.", len(matches))
     except Exception as e:
-        logging.error(f"Error updating data: {str(e)}", exc_info=True)
+        logging.error("Error updating data: %s", e, exc_info=True)
 
 def prompt_interface_choice() -> str:
     """Prompt the user to choose an interface and validate the input.
@@ -67,42 +74,103 @@ def prompt_interface_choice() -> str:
         if choice in ("1", "2"):
             return choice
         else:
-            logging.warning(f"Invalid interface choice: {choice}")
+            logging.warning("Invalid interface choice: %s", choice)
             print("Invalid input. Please enter '1' for CLI or '2' for Web Interface.\n")
 
-def main() -> None:
+def resolve_interface_choice(interface: Optional[str] = None) -> str:
+    """Determine which interface to start, prompting only when it cannot be inferred.
+
+    The choice is taken from, in order: the `interface` argument, the
+    GOAI_INTERFACE environment variable, and CLI when stdin is not a terminal.
+    Only an interactive launch with none of these set prompts the user.
+
+    Args:
+        interface (Optional[str]): "cli" or "web", usually from --interface.
+
+    Return:
+        str: The chosen interface option ("1" for CLI or "2" for Web)
+    """
+    interface = interface or os.environ.get("GOAI_INTERFACE")
+    if interface:
+        choice: Optional[str] = {"cli": "1", "web": "2"}.get(interface.strip().lower())
+        if choice:
+            logging.debug("Interface selected without prompt: %s", interface)
+            return choice
+        logging.warning("Ignoring unknown interface: %s", interface)
+
+    if not sys.stdin.isatty():
+        logging.info("stdin is not a terminal, starting CLI interface without prompting")
+        return "1"
+
+    return prompt_interface_choice()
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser.
+
+    Arguments can also be read from a file by passing `@path`, one argument per line.
+
+    Returns:
+        argparse.ArgumentParser: The configured parser.
+    """
     parser: argparse.ArgumentParser = argparse.ArgumentParser(
         description="""goAI Talk - Football Match Results Q&A Bot that provides information 
                        about yesterday's football matches through either a CLI or web interface.\n
-                       Use --update to fetch the latest match data or --test to run in test mode with sample data."""
+                       Use --update to fetch the latest match data or --test to run in test mode with sample data.""",
+        fromfile_prefix_chars="@"
     )
-    parser.add_argument("--update", action="store_true", help="Update match data")
+    parser.add_argument("--update", action="store_true", help="Update match data even if the stored data is still fresh")
+    parser.add_argument("--ttl", type=float, default=None,
+                        help="Hours before stored match data is fetched again (default: DATA_TTL_HOURS setting, 6)")
     parser.add_argument("--test", action="store_true", help="Test mode: Uses test data from tests/test_data.json")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--log-console", action="store_true", help="Show logs in console")
-    args: argparse.Namespace = parser.parse_args()
+    parser.add_argument("--no-ui", action="store_true",
+                        help="Exit after updating match data without starting an interface")
+    parser.add_argument("--banner", action="store_true", help="Show the goAI Talk banner and exit")
+    parser.add_argument("--interface", choices=["cli", "web"],
+                        help="Interface to start without prompting (default: GOAI_INTERFACE, otherwise ask)")
+    return parser
+
+def main() -> None:
+    args: argparse.Namespace = build_parser().parse_args()
+    if args.banner:
+        print_banner()
+        return
+
+    from app.logging_config import setup_logging
+    from config import settings
 
     # Setup logging configuration
-    setup_logging(debug_mode=args.debug, console_logs=args.log_console)
+    setup_logging(debug_mode=args.debug, console_logs=args.log_console,
+                  retention_days=settings.log_retention_days)
 
     logging.info("Starting goAI Talk application")
-    logging.info(f"Command line arguments: update={args.update}, test={args.test}, debug={args.debug}")
+    logging.info("Command line arguments: update=%s, test=%s, debug=%s, ttl=%s",
+                 args.update, args.test, args.debug, args.ttl)
+
+    # Fetches only when forced or when the stored data is older than the TTL,
+    # so an empty match day does not trigger a refetch on every launch.
+    update_data(use_test_data=args.test, ttl_hours=args.ttl, force=args.update)
+    if args.no_ui:
+        logging.info("--no-ui set, exiting after data update")
+        return
 
+    from app.database_manager.database import Database
     db: Database = Database(settings)
-    matches: List[Match] = db.retrieve_yesterdays_matches_from_db()
-    if not matches or args.update:
-        logging.info("No matches found or update requested, fetching fresh data")
-        update_data(use_test_data=args.test)
 
-    choice: str = prompt_interface_choice()
+    choice: str = resolve_interface_choice(args.interface)
+    # Interface modules are imported only for the chosen interface,
+    # so the CLI never loads FastAPI/uvicorn and the web server never loads rich.
     if choice == "2":
+        from app.web_interface.web import run_server
         logging.info("Starting web server. Access at http://localhost:8000")
         run_server()
     else:
+        from rich.console import Console
+        from app.cli_interface.cli import CLI
         logging.info("Starting CLI interface")
         console: Console = Console()
-        qna_engine: QnAEngine = QnAEngine(settings, db)
-        cli: CLI = CLI(console, db, qna_engine)
+        cli: CLI = CLI(console, db, settings)
         cli.run()
 
 if __name__ == "__main__":
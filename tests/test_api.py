@@ -1,17 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 '''
-          ___
-      .:::---:::.
-    .'--:     :--'.                      ___     ____   ______        __ __  
-   /.'   \   /   `.\      ____ _ ____   /   |   /  _/  /_  __/____ _ / // /__
-  | /'._ /:::\ _.'\ |    / __ `// __ \ / /| |   / /     / /  / __ `// // //_/
-  |/    |:::::|    \|   / /_/ // /_/ // ___ | _/ /     / /  / /_/ // // ,<   
-  |:\ .''-:::-''. /:|   \__, / \____//_/  |_|/___/    /_/   \__,_//_//_/|_|  
-   \:|    `|`    |:/   /____/                                                
-    '.'._.:::._.'.'
-      '-:::::::-'
-
 goAI Talk - Football Match Results Q&A Bot
 File: tests/test_api.py
 Author: Hosu Kim
@@ -24,13 +13,16 @@ Description:
 
 import requests
 import json
-from datetime import datetime, timedelta
+from datetime import date as date_type, datetime, timedelta, timezone
 import os
 import sys
-from typing import Dict, List, Optional, Any, Union
+import threading
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
 
 # Add parent directory to Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 from config import Settings
 
 class FootballAPITester:
@@ -44,6 +36,8 @@ class FootballAPITester:
     config: Settings
     base_url: str
     headers: Dict[str, str]
+    _local: threading.local
+    _yesterday: str
 
     def __init__(self, config: Settings) -> None:
         """Initialize the FootballAPITester.
@@ -54,6 +48,26 @@ class FootballAPITester:
         self.config = config
         self.base_url = self.config.api_football_url
         self.headers = {"x-apisports-key": self.config.api_football_key.get_secret_value()}
+        # Per-thread sessions, created on first use by _session()
+        self._local = threading.local()
+        # Default test date, computed once and shared by every fixtures request
+        self._yesterday = (date_type.today() - timedelta(days=1)).isoformat()
+
+    def _session(self) -> requests.Session:
+        """Return the calling thread's session, creating it on first use.
+
+        requests does not guarantee that Session is thread-safe, so each worker
+        thread gets its own session with the auth headers set once.
+
+        Returns:
+            requests.Session: The session for the current thread.
+        """
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
 
     def _call_api(self, endpoint_url: str, params: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
         """Interanl method to call the API.
@@ -66,10 +80,10 @@ class FootballAPITester:
             Optional[requests.Response]: The API response object or None if the request failed.
         """
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = self._session().get(
                 endpoint_url,
-                headers=self.headers,
-                params=params
+                params=params,
+                timeout=10
             )
             return response
         except requests.exceptions.RequestException as e:
@@ -114,33 +128,54 @@ class FootballAPITester:
             print("\nError Response:")
             print(response.text)
 
-    def test_fixtures_endpoint(self, date: Optional[str] = None) -> None:
+    def _fixtures_request(self, date: Optional[str] = None) -> Tuple[str, Dict[str, str]]:
+        """Build the URL and parameters for a fixtures request.
+
+        Args:
+            date (Optional[str]): Date string in YYYY-MM-DD format.
+                                If not provided, yesterday's date is used.
+
+        Returns:
+            Tuple[str, Dict[str, str]]: The endpoint URL and query parameters.
+        """
+        if date is None:
+            date = self._yesterday
+        return f"{self.base_url}/fixtures", {"date": date, "status": "FT-AET-PEN"}
+
+    def test_fixtures_endpoint(self, date: Optional[str] = None,
+                               response_future: Optional[Future] = None) -> None:
         """Test the fixtures endpoing.
         
         Args:
             date (Optional[str]): Date string in YYYY-MM-DD format.
                                 If not provided, yesterday's date is used.
+            response_future (Optional[Future]): A request already in flight for this endpoint.
+                                If not provided, the API is called directly.
         """
-        if date is None:
-            date = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+        endpoint_url, params = self._fixtures_request(date)
 
         print(f"\n{'-'*60}")
         print(f"Testing Fixtures Endpoint")
         print(f"{'-'*60}")
-        print(f"Current UTC Time: {datetime.utcnow().strftime('%Y-%m-%d %%H:%M:%S')}")
-        print(f"Testing Date: {date}")
-
-        endpoint_url = f"{self.base_url}/fixtures"
-        params = {"date": date, "status": "FT-AET-PEN"}
+        print(f"Current UTC Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Testing Date: {params['date']}")
 
         print(f"URL: {endpoint_url}")
         print(f"Parameters: {params}")
 
-        response: Optional[requests.Response] = self._call_api(endpoint_url, params)
+        if response_future is not None:
+            response: Optional[requests.Response] = response_future.result()
+        else:
+            response = self._call_api(endpoint_url, params)
         self._print_response_details(response)
 
-    def test_status_endpoint(self) -> None:
-        """Test the status endpoint."""
+    def test_status_endpoint(self, response_future: Optional[Future] = None) -> None:
+        """Test the status endpoint.
+
+        Args:
+            response_future (Optional[Future]): A request already in flight for this endpoint.
+                                If not provided, the API is called directly.
+        """
         print(f"\n{'-'*60}")
         print(f"Testing Status Endpoint")
         print(f"{'-'*60}")
@@ -150,7 +185,10 @@ class FootballAPITester:
         print(f"URL: {endpoint_url}")
         print(f"Parameters: {{}}")
 
-        response: Optional[requests.Response] = self._call_api(endpoint_url)
+        if response_future is not None:
+            response: Optional[requests.Response] = response_future.result()
+        else:
+            response = self._call_api(endpoint_url)
         self._print_response_details(response)
 
     def test_api_connection(self) -> None:
@@ -161,16 +199,23 @@ class FootballAPITester:
         print(f"API URL Base: {self.base_url}")
         print(f"Headers: {self.headers}")
 
-        # Test fixtures endpoint with yesterday's date
-        self.test_fixtures_endpoint()
+        # Both endpoints are requested at once so the wait is a single round-trip;
+        # results are still printed in order.
+        fixtures_url, fixtures_params = self._fixtures_request()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fixtures_future = executor.submit(self._call_api, fixtures_url, fixtures_params)
+            status_future = executor.submit(self._call_api, f"{self.base_url}/status")
+
+            # Test fixtures endpoint with yesterday's date
+            self.test_fixtures_endpoint(fixtures_params["date"], fixtures_future)
 
-        # Test status endpoint
-        self.test_status_endpoint()
+            # Test status endpoint
+            self.test_status_endpoint(status_future)
 
 def print_system_info() -> None:
     """Print system information for debugging."""
     print("\nStarting API test...")
-    print(f"Current UTC Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Current UTC Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Current working directory: {os.getcwd()}")
     print(f"Python path: {sys.path}")
 